@@ -3,6 +3,14 @@
 Methods
 -------
     main : Launch the GUI.
+    title_font : Return the font of the file name shown above the metadata.
+    write_info_update : Write a PDF with a new document information dictionary
+        appended as an incremental update.
+    write_xref_table : Write a cross-reference table and its trailer.
+    write_xref_stream : Write a cross-reference stream.
+    write_document : Return a PDF rewritten with a new document information dictionary.
+    run_in_background : Run a function in the global thread pool,
+        keeping the GUI responsive until it returns.
 
 Classes
 -------
@@ -10,27 +18,418 @@ Classes
     MetadataPanel : Handle the central widget of the main window.
         It is effectively the interface through which the user modifies the metadata.
     TagData : Contain all the objects related to a metadata field:
-        its value, the GUI elements to modify it, the associated signals."""
+        its value, the GUI elements to modify it, the associated signals.
+    BackgroundTask : Run a function in a thread of the global thread pool.
+    TaskSignals : Contain the signals emitted by a BackgroundTask.
+
+Exceptions
+----------
+    TaskCancelled : Raised when the user stops waiting for a BackgroundTask."""
+
+# The GUI is kept in a single module, as the module docstring describes.
+# pylint: disable=too-many-lines
 
 from __future__ import annotations
 import os
+import re
+import shutil
 import sys
-from pathlib import Path
-from typing import Callable, Optional
+import tempfile
+import threading
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Optional
 from dataclasses import dataclass
-from collections import defaultdict
-import pypdf
+from collections import OrderedDict
 from PyQt6 import QtWidgets, QtGui, QtCore
-from pypdf.errors import PdfReadError
 from ._version import __version__
 
+# pypdf is only imported when a file is opened or saved, to speed up the launch of the GUI.
+if TYPE_CHECKING:
+    import pypdf
+
 APPLICATION_NAME = "PDF Metadata Editor"
 URL_GITHUB = "https://github.com/Manitary/PDF-Metadata-Editor"
 
-TAGS = ["/Title", "/Author", "/Subject", "/Keywords", "/Producer", "/Creator"]
+TAGS = ("/Title", "/Author", "/Subject", "/Keywords", "/Producer", "/Creator")
+TAGS_SET = frozenset(TAGS)
+# Form labels of the editable tags, without the leading "/".
+TAG_LABELS = tuple(tag[1:] for tag in TAGS)
+
+# Maximum total size (bytes) of the files whose PdfReader objects are kept in memory
+# for quick reopening. Each of them holds the whole file.
+READER_CACHE_BYTES = 64 << 20
+# Size of the chunks a file is read in, checking in between whether the user cancelled.
+READ_CHUNK_SIZE = 1 << 20
+# Time (ms) after which a progress dialog is shown while waiting for a background task.
+PROGRESS_DIALOG_DELAY = 200
+
+# Modified fields are highlighted by toggling their "edited" dynamic property.
+# (QLineEdit already has a "modified" property, cleared by setText.)
+STYLESHEET = 'QLineEdit[edited="true"] { background-color: red; }'
+
+# Header of an indirect object, used to recognise cross-reference streams.
+OBJECT_HEADER = re.compile(rb"\s*\d+\s+\d+\s+obj")
+
+
+# The update is assembled in a single pass, each offset and object number being needed
+# by what follows; splitting it further would only pass them around.
+# pylint: disable-next=too-many-locals
+def write_info_update(
+    file_reader: pypdf.PdfReader,
+    metadata: dict[str, Any],
+    stream: BinaryIO,
+    original: bool = True,
+) -> bool:
+    """Write the file of ``file_reader`` with ``metadata`` as its new document information.
+
+    The original bytes are written unchanged, followed by an incremental update
+    (PDF 1.7 specification, section 7.5.6) containing only the new document information
+    dictionary and a cross-reference section pointing to it.
+    The cross-reference section is a table or a stream, matching the last one in the file.
+    Nothing is written and False is returned if the update is not supported,
+    i.e. the file is encrypted or its last cross-reference section cannot be located;
+    otherwise return True.
+
+    Parameters
+    ----------
+    file_reader : PdfReader
+        The PdfReader object of the file to update.
+    metadata : dict[str, Any]
+        The new document information dictionary, tag -> value.
+    stream : BinaryIO
+        The stream the updated file is written to.
+    original : bool
+        If False, only the update is written, e.g. to append it to the original file.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from pypdf.generic import (
+        DictionaryObject,
+        IndirectObject,
+        NameObject,
+        NumberObject,
+        PdfObject,
+        create_string_object,
+    )
+
+    if file_reader.is_encrypted:
+        return False
+    file_reader.stream.seek(0)
+    data = file_reader.stream.read()
+    # Offset of the last cross-reference section.
+    tail = data[-1024:]
+    startxref = tail.rfind(b"startxref")
+    if startxref < 0:
+        return False
+    try:
+        prev = int(tail[startxref + 9 :].split()[0])
+    except (IndexError, ValueError):
+        return False
+    if data[prev:].lstrip().startswith(b"xref"):
+        xref_stream = False
+    elif OBJECT_HEADER.match(data, prev):
+        xref_stream = True
+    else:
+        return False
+
+    size = int(file_reader.trailer["/Size"])
+    # The trailer may have no document information dictionary at all.
+    info_reference = (
+        file_reader.trailer.raw_get("/Info") if "/Info" in file_reader.trailer else None
+    )
+    if isinstance(info_reference, IndirectObject):
+        info_number, info_generation = info_reference.idnum, info_reference.generation
+    else:
+        info_number, info_generation = size, 0
+        size += 1
+    info = DictionaryObject(
+        {
+            NameObject(tag): (
+                value
+                if isinstance(value, PdfObject)
+                else create_string_object(str(value))
+            )
+            for tag, value in metadata.items()
+        }
+    )
+
+    update = BytesIO()
+    update.write(b"\n")
+    info_offset = len(data) + update.tell()
+    update.write(b"%d %d obj\n" % (info_number, info_generation))
+    info.write_to_stream(update)
+    update.write(b"\nendobj\n")
+    xref_offset = len(data) + update.tell()
+    trailer = DictionaryObject()
+    trailer[NameObject("/Root")] = file_reader.trailer.raw_get("/Root")
+    trailer[NameObject("/Info")] = IndirectObject(info_number, info_generation, None)
+    trailer[NameObject("/Prev")] = NumberObject(prev)
+    if "/ID" in file_reader.trailer:
+        trailer[NameObject("/ID")] = file_reader.trailer.raw_get("/ID")
+    trailer[NameObject("/Size")] = NumberObject(size)
+    entries = {info_number: (info_offset, info_generation)}
+    if xref_stream:
+        write_xref_stream(update, trailer, entries, xref_offset)
+    else:
+        write_xref_table(update, trailer, entries)
+    update.write(b"startxref\n%d\n%%%%EOF\n" % xref_offset)
+
+    if original:
+        stream.write(data)
+    stream.write(update.getvalue())
+    return True
+
+
+def write_xref_table(
+    stream: BinaryIO,
+    trailer: pypdf.generic.DictionaryObject,
+    entries: dict[int, tuple[int, int]],
+) -> None:
+    """Write a cross-reference table with the in-use ``entries``, followed by ``trailer``.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The stream the table is written to.
+    trailer : DictionaryObject
+        The trailer dictionary, complete with its "/Size" entry.
+    entries : dict[int, tuple[int, int]]
+        Object number -> (offset, generation number) of the objects in the table.
+    """
+    # The entry of object 0 is not required, but some readers expect the table to start with it.
+    stream.write(b"xref\n0 1\n0000000000 65535 f\r\n")
+    for number, (offset, generation) in sorted(entries.items()):
+        stream.write(b"%d 1\n%010d %05d n\r\n" % (number, offset, generation))
+    stream.write(b"trailer\n")
+    trailer.write_to_stream(stream)
+    stream.write(b"\n")
+
+
+def write_xref_stream(
+    stream: BinaryIO,
+    trailer: pypdf.generic.DictionaryObject,
+    entries: dict[int, tuple[int, int]],
+    offset: int,
+) -> None:
+    """Write a cross-reference stream with the in-use ``entries`` and the entries of ``trailer``.
+
+    The stream is an object itself: it takes the next object number given by "/Size",
+    which is increased accordingly, and has an entry for itself, after the other ones.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The stream the cross-reference stream is written to.
+    trailer : DictionaryObject
+        The trailer dictionary, complete with its "/Size" entry; it is modified in place.
+    entries : dict[int, tuple[int, int]]
+        Object number -> (offset, generation number) of the objects in the section.
+    offset : int
+        The offset in the file at which the cross-reference stream is written.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from pypdf.generic import ArrayObject, NameObject, NumberObject
+
+    number = int(trailer["/Size"])
+    rows = sorted(entries.items()) + [(number, (offset, 0))]
+    width = max(4, (max(row[1][0] for row in rows).bit_length() + 7) // 8)
+    data = b"".join(
+        b"\x01" + row_offset.to_bytes(width, "big") + generation.to_bytes(2, "big")
+        for _, (row_offset, generation) in rows
+    )
+    trailer[NameObject("/Type")] = NameObject("/XRef")
+    trailer[NameObject("/Size")] = NumberObject(number + 1)
+    trailer[NameObject("/Index")] = ArrayObject(
+        NumberObject(n) for row_number, _ in rows for n in (row_number, 1)
+    )
+    trailer[NameObject("/W")] = ArrayObject(NumberObject(n) for n in (1, width, 2))
+    trailer[NameObject("/Length")] = NumberObject(len(data))
+    stream.write(b"%d 0 obj\n" % number)
+    trailer.write_to_stream(stream)
+    stream.write(b"\nstream\n" + data + b"\nendstream\nendobj\n")
+
+
+def write_document(file_reader: pypdf.PdfReader, metadata: dict[str, Any]) -> bytes:
+    """Return the document of ``file_reader`` rewritten with ``metadata`` as document information.
+
+    The whole document is serialised again, which can take a while for large files;
+    it does not use any Qt object, so that it can run in a BackgroundTask.
+
+    Parameters
+    ----------
+    file_reader : PdfReader
+        The reader of the document.
+    metadata : dict[str, Any]
+        The new document information dictionary, tag -> value.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import pypdf
+
+    # Note: PdfWriter initialises the "/Producer" metadata with "pypdf".
+    file_writer = pypdf.PdfWriter()
+    # Unlike append_pages_from_reader, cloning the document root keeps
+    # outlines, forms, page labels, etc., and is not slower.
+    file_writer.clone_reader_document_root(file_reader)
+    file_writer.add_metadata(metadata)
+    stream = BytesIO()
+    file_writer.write(stream)
+    return stream.getvalue()
+
+
+@lru_cache(maxsize=None)
+def title_font() -> QtGui.QFont:
+    """Return the font of the file name shown above the metadata.
+
+    It is created on first use, since a QFont requires a QApplication,
+    and shared by every MetadataPanel afterwards."""
+    return QtGui.QFont("Sans Serif", 14)
+
+
+class TaskCancelled(Exception):
+    """The user stopped waiting for the result of a background task."""
+
+
+# A QObject is needed only to declare the signals.
+# pylint: disable-next=too-few-public-methods
+class TaskSignals(QtCore.QObject):
+    """The signals emitted by a BackgroundTask.
+
+    Signals
+    -------
+    finished(object)
+        Emitted with the value returned by the function.
+    failed(Exception)
+        Emitted with the exception raised by the function.
+    """
+
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(Exception)
+
+
+# QThreadPool only calls run.
+# pylint: disable-next=too-few-public-methods
+class BackgroundTask(QtCore.QRunnable):
+    """A class that runs a function in a thread of the global thread pool.
+
+    The outcome is reported through the signals of the ``signals`` attribute,
+    which are delivered to the thread the task was created in.
+
+    Attributes
+    ----------
+    function : Callable
+        The function to run.
+    args : tuple
+        The positional arguments of ``function``.
+    kwargs : dict
+        The keyword arguments of ``function``.
+    signals : TaskSignals
+        The object emitting the ``finished`` and ``failed`` signals.
+    cancelled : Event
+        Set when the result is no longer wanted.
+        If it is set while the task is queued, ``function`` is not called
+        and the task fails with TaskCancelled; ``function`` may also check it to stop early.
+    """
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        *args,
+        cancelled: Optional[threading.Event] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.cancelled = threading.Event() if cancelled is None else cancelled
+
+    def run(self) -> None:
+        """Call ``function`` and emit the signal corresponding to the outcome.
+
+        The function is not called if the task was cancelled before it started."""
+        if self.cancelled.is_set():
+            self.signals.failed.emit(TaskCancelled())
+            return
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        # Any exception is handed over to the thread waiting for the result.
+        # pylint: disable-next=broad-exception-caught
+        except Exception as exception:
+            self.signals.failed.emit(exception)
+        else:
+            self.signals.finished.emit(result)
 
-BG_DEFAULT = QtCore.Qt.GlobalColor.white
-BG_HIGHLIGHT = QtCore.Qt.GlobalColor.red
+
+def run_in_background(
+    parent: Optional[QtWidgets.QWidget],
+    label: str,
+    function: Callable[..., Any],
+    *args,
+    cancelled: Optional[threading.Event] = None,
+    ended: Optional[Callable[[], None]] = None,
+    **kwargs,
+) -> Any:
+    """Return the result of ``function(*args, **kwargs)``, computed in the global thread pool.
+
+    The GUI keeps processing events while waiting; if the function takes long enough,
+    a modal progress dialog with a Cancel button is displayed.
+    Exceptions raised by the function are raised again in the calling thread.
+
+    Parameters
+    ----------
+    parent : QWidget
+        The parent of the progress dialog.
+    label : str
+        The text displayed in the progress dialog.
+    function : Callable
+        The function to run.
+    cancelled : Event, optional
+        The event set when the user presses Cancel, for ``function`` to check
+        periodically and stop early (e.g. by raising TaskCancelled).
+    ended : Callable, optional
+        Called in the calling thread once the function has returned or raised,
+        even if the user stopped waiting for it.
+
+    Raises
+    ------
+    TaskCancelled
+        If the user pressed Cancel before the function returned.
+        A function that does not check ``cancelled`` keeps running,
+        but its result is discarded.
+    """
+    outcome: dict[str, Any] = {}
+    loop = QtCore.QEventLoop()
+    task = BackgroundTask(function, *args, cancelled=cancelled, **kwargs)
+    task.signals.finished.connect(lambda result: outcome.setdefault("result", result))
+    task.signals.failed.connect(
+        lambda exception: outcome.setdefault("error", exception)
+    )
+    task.signals.finished.connect(loop.quit)
+    task.signals.failed.connect(loop.quit)
+    if ended is not None:
+        task.signals.finished.connect(ended)
+        task.signals.failed.connect(ended)
+    dialog = QtWidgets.QProgressDialog(label, "Cancel", 0, 0, parent)
+    dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+    # setMinimumDuration only applies once a progress value is set, which never happens
+    # for a busy indicator: show the dialog explicitly instead.
+    timer = QtCore.QTimer(dialog)
+    timer.setSingleShot(True)
+    timer.timeout.connect(dialog.show)
+    timer.start(PROGRESS_DIALOG_DELAY)
+    dialog.canceled.connect(task.cancelled.set)
+    dialog.canceled.connect(loop.quit)
+    QtCore.QThreadPool.globalInstance().start(task)
+    loop.exec()
+    timer.stop()
+    dialog.reset()
+    dialog.deleteLater()
+    if "error" in outcome:
+        raise outcome["error"]
+    if "result" not in outcome:
+        raise TaskCancelled
+    return outcome["result"]
 
 
 @dataclass
@@ -44,11 +443,7 @@ class TagData:
     line_edit : QLineEdit
         The widget to display and modify the value.
     reset_button : QPushButton
-        The button to reset the QLineEdit text.
-    reset_function : Callable
-        The slot called when ``reset_button`` is pressed.
-    save_function : Callable
-        The function called to save the ``line_edit`` text as new ``value``.
+        The button to reset the QLineEdit text, None if not interactive.
     modified : bool
         True if the ``line_edit`` text differs from ``value``.
     interactive : bool
@@ -60,15 +455,21 @@ class TagData:
         Return a TagData object with the given value and an interactive ``line_edit``.
     from_metadata_not_interactive(value="")
         Return a TagData object with the given value and a non-interactive ``line_edit``.
-    change_widget_background_colour(widget, colour)
-        Change the background colour of ``widget`` to ``colour``.
+    reset_function()
+        Reset the ``line_edit`` text to ``value``. It is the slot called when ``reset_button``
+        is pressed.
+    save_function()
+        Save the ``line_edit`` text as new ``value``.
+    edit_function()
+        Update ``modified`` and the ``line_edit`` background colour.
+        It is the slot called when the ``line_edit`` text is edited by the user.
+    mark_modified(widget, flag)
+        Set the "edited" property of ``widget`` to ``flag``, updating its style.
     """
 
     value: str = ""
-    line_edit: QtWidgets.QLineEdit = None
-    reset_button: Optional[QtWidgets.QPushButton] = lambda: None
-    reset_function: Optional[Callable[[None], None]] = lambda: None
-    save_function: Optional[Callable[[None], None]] = lambda: None
+    line_edit: Optional[QtWidgets.QLineEdit] = None
+    reset_button: Optional[QtWidgets.QPushButton] = None
     modified: bool = False
     interactive: bool = False
 
@@ -81,44 +482,15 @@ class TagData:
         value : str
             The value of the metadata.
         """
-        tag = TagData(value=str(value))
-        line_edit = QtWidgets.QLineEdit(value)
-        reset_button = QtWidgets.QPushButton("Reset")
-
-        def reset_function() -> None:
-            """Reset the text of ``line_edit`` to ``value``.
-
-            It is the slot called when reset_button is pressed."""
-            line_edit.setText(tag.value)
-
-        def save_function() -> None:
-            """Set ``value`` to the text of ``line_edit``.
-
-            Additionally, set ``modified`` to False, and reset ``line_edit`` background colour.
-            It is called when the "Save" button is pressed."""
-            tag.modified = False
-            tag.value = line_edit.text()
-            TagData.change_widget_background_colour(line_edit, BG_DEFAULT)
-
-        def edit_function() -> None:
-            """Update ``modified`` and ``line_edit`` background colour based on its text.
-
-            It is the slot called when ``line_edit`` text is changed."""
-            if line_edit.text() == value:
-                tag.modified = False
-                TagData.change_widget_background_colour(line_edit, BG_DEFAULT)
-            else:
-                tag.modified = True
-                TagData.change_widget_background_colour(line_edit, BG_HIGHLIGHT)
-
-        line_edit.textChanged.connect(edit_function)
-        reset_button.clicked.connect(reset_function)
-
-        tag.line_edit = line_edit
-        tag.reset_button = reset_button
-        tag.reset_function = reset_function
-        tag.save_function = save_function
-        tag.interactive = True
+        value = str(value)
+        tag = TagData(
+            value=value,
+            line_edit=QtWidgets.QLineEdit(value),
+            reset_button=QtWidgets.QPushButton("Reset"),
+            interactive=True,
+        )
+        tag.line_edit.textEdited.connect(tag.edit_function)
+        tag.reset_button.clicked.connect(tag.reset_function)
         return tag
 
     @classmethod
@@ -134,27 +506,56 @@ class TagData:
         line_edit.setEnabled(False)
         return TagData(value=value, line_edit=line_edit)
 
+    def reset_function(self) -> None:
+        """Reset the text of ``line_edit`` to ``value``, if interactive.
+
+        It is the slot called when ``reset_button`` is pressed."""
+        if self.interactive:
+            self.line_edit.setText(self.value)
+            # setText does not emit textEdited.
+            self.edit_function()
+
+    def save_function(self) -> None:
+        """Set ``value`` to the text of ``line_edit``, if interactive.
+
+        Additionally, set ``modified`` to False, and reset ``line_edit`` background colour.
+        It is called when the "Save" button is pressed."""
+        if self.interactive:
+            self.modified = False
+            self.value = self.line_edit.text()
+            TagData.mark_modified(self.line_edit, False)
+
+    def edit_function(self) -> None:
+        """Update ``modified`` and ``line_edit`` background colour based on its text.
+
+        It is the slot called when ``line_edit`` text is edited by the user."""
+        modified = self.line_edit.text() != self.value
+        # Most keystrokes do not change whether the field is modified.
+        if modified != self.modified:
+            self.modified = modified
+            TagData.mark_modified(self.line_edit, modified)
+
     @staticmethod
-    def change_widget_background_colour(
-        widget: QtWidgets.QWidget, colour: QtCore.Qt.GlobalColor
-    ) -> None:
-        """Change a widget background colour to the assigned colour.
+    def mark_modified(widget: QtWidgets.QWidget, flag: bool) -> None:
+        """Set the "edited" property of a widget, and restyle it if the property changed.
 
-        Currently only accepts PyQt pre-set colours.
+        The background colour is given by ``STYLESHEET``, set on the main window.
 
         Parameters
         ----------
         widget : QWidget
             The widget to modify.
-        colour : GlobalColor
-            A PyQt pre-set colour.
-            See complete list at https://doc.qt.io/qt-6/qt.html#GlobalColor-enum.
+        flag : bool
+            The new value of the property.
         """
-        palette = QtGui.QPalette()
-        palette.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor(colour))
-        widget.setPalette(palette)
+        if widget.property("edited") == flag:
+            return
+        widget.setProperty("edited", flag)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
 
+# pylint: disable-next=too-many-instance-attributes
 class MetadataPanel(QtWidgets.QWidget):
     """A class that handles the effective GUI responsible for editing metadata.
 
@@ -174,6 +575,20 @@ class MetadataPanel(QtWidgets.QWidget):
         A dictionary to easily access other interactive widgets that are not tied to a single tag.
     backup : bool
         If True, the file at ``file_path`` is renamed for backup before saving the edited metadata.
+    incremental : bool
+        If True, the edited metadata are appended to the original file as an incremental update
+        whenever possible, instead of rewriting the whole document.
+    running_tasks : int
+        The number of background tasks still using ``file_reader``,
+        including those the user stopped waiting for. Saving is disabled until they end.
+
+    Signals
+    -------
+    file_saved(str)
+        Emitted with ``file_path`` after the edited metadata have been written to disk.
+    saving(bool)
+        Emitted with True before the edited metadata are written, and with False afterwards.
+        Writing may run a nested event loop in between.
 
     Methods
     -------
@@ -181,12 +596,27 @@ class MetadataPanel(QtWidgets.QWidget):
         Create the widgets to include in ``form`` based on the contents of ``tags``.
     create_tags(file_reader)
         Return a dictionary tag -> TagData from the metadata of the file_reader object.
-    create_file_backup()
-        Rename the file at ``file_path`` for backup purposes.
+    create_file_backup(file_path, copy=False)
+        Rename (or copy) the file at ``file_path`` for backup purposes.
+    reset_all()
+        Reset every editable field to its value.
     save_file()
-        If any metadata field was edited, save the changes into a new file with path ``file_path``.
+        If any metadata field was edited, save the changes into the file at ``file_path``.
+    append_file(update)
+        Append an incremental update to the file at ``file_path``, if possible.
+    rewrite_file(metadata, update)
+        Write the file at ``file_path`` with ``metadata`` as its new document information.
+    task_ended()
+        Record the end of a background task using ``file_reader``.
+    reload_file(data)
+        Replace ``file_reader`` with a PdfReader of the contents just saved.
+    disconnect_signals()
+        Disconnect the signals of the panel and of its interactive widgets.
     """
 
+    file_saved = QtCore.pyqtSignal(str)
+    saving = QtCore.pyqtSignal(bool)
+
     def __init__(self, file_reader: pypdf.PdfReader, file_path: str) -> None:
         """Create the widget from a PdfReader object.
 
@@ -201,6 +631,8 @@ class MetadataPanel(QtWidgets.QWidget):
         self.file_path = file_path
         self.file_reader = file_reader
         self.backup = True
+        self.incremental = True
+        self.running_tasks = 0
         self.tags = self.create_tags(file_reader)
         self.form, self.other_interactive_widgets = self.build_form()
 
@@ -213,108 +645,339 @@ class MetadataPanel(QtWidgets.QWidget):
         file_reader : PdfReader
             The PdfReader object whose metadata are used.
         """
-        tags = defaultdict(TagData)
+        # The document may have no document information dictionary at all.
+        metadata = file_reader.metadata or {}
+        editable = dict.fromkeys(TAGS, "")
+        other = {}
+        # Single pass over the dictionary; indexing (unlike get and items)
+        # resolves values stored as indirect objects.
+        for tag in metadata:
+            if tag in TAGS_SET:
+                editable[tag] = metadata[tag]
+            else:
+                other[tag] = metadata[tag]
+        tags: dict[str, TagData] = {}
         # Editable fields
-        for tag in TAGS:
-            tags[tag] = TagData.from_metadata_interactive(
-                file_reader.metadata.get(tag, "")
-            )
+        for tag, value in editable.items():
+            tags[tag] = TagData.from_metadata_interactive(value)
         # Other (non-editable) fields
-        for tag, value in file_reader.metadata.items():
-            if tag not in TAGS:
-                tags[tag] = TagData.from_metadata_not_interactive(value)
+        for tag, value in other.items():
+            tags[tag] = TagData.from_metadata_not_interactive(value)
         return tags
 
     def build_form(
         self,
     ) -> tuple[QtWidgets.QFormLayout, dict[str, QtWidgets.QPushButton]]:
-        """Return the form created from the tags, and the Save/Reset All buttons."""
-        form = QtWidgets.QFormLayout(self)
+        """Return the form created from the tags, and the Save/Reset All buttons.
+
+        The form is populated while detached, and installed on the panel at the end."""
+        form = QtWidgets.QFormLayout()
+
+        def add_empty_row() -> None:
+            # A line of empty space, without creating a widget for it.
+            form.addItem(
+                QtWidgets.QSpacerItem(
+                    0,
+                    self.fontMetrics().height(),
+                    QtWidgets.QSizePolicy.Policy.Minimum,
+                    QtWidgets.QSizePolicy.Policy.Fixed,
+                )
+            )
+
         # File name
-        title = QtWidgets.QLabel(Path(self.file_path).name)
+        title = QtWidgets.QLabel(os.path.basename(self.file_path))
         title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QtGui.QFont("Sans Serif", 14))
+        title.setFont(title_font())
         form.addRow(title)
-        # Empty space
-        form.addRow(QtWidgets.QLabel())
+        add_empty_row()
         # File Path
         path_field = QtWidgets.QLineEdit(str(self.file_path))
         path_field.setEnabled(False)
         form.addRow("Path", path_field)
         # Editable fields
-        for tag in TAGS:
+        for tag, label in zip(TAGS, TAG_LABELS):
+            data = self.tags[tag]
             row_layout = QtWidgets.QHBoxLayout()
-            row_layout.addWidget(self.tags[tag].line_edit)
-            row_layout.addWidget(self.tags[tag].reset_button)
-            form.addRow(tag[1:], row_layout)
+            row_layout.addWidget(data.line_edit)
+            row_layout.addWidget(data.reset_button)
+            form.addRow(label, row_layout)
         # Other (non-editable) fields
         for tag, data in self.tags.items():
             if not data.interactive:
                 form.addRow(tag[1:], data.line_edit)
-        # Empty space
-        form.addRow(QtWidgets.QLabel())
+        add_empty_row()
         # Save button
         save_button = QtWidgets.QPushButton("Save")
         save_button.clicked.connect(self.save_file)
         # Reset All button
         reset_button = QtWidgets.QPushButton("Reset All")
-        for data in self.tags.values():
-            reset_button.clicked.connect(data.reset_function)
+        reset_button.clicked.connect(self.reset_all)
         # Align save/reset button horizontally
         buttons_layout = QtWidgets.QHBoxLayout()
         buttons_layout.addWidget(save_button)
         buttons_layout.addWidget(reset_button)
         form.addRow(buttons_layout)
+        self.setLayout(form)
         # Return the form and the save/reset buttons
         other_interactive_widgets = {"save": save_button, "reset": reset_button}
         return form, other_interactive_widgets
 
+    @QtCore.pyqtSlot()
+    def reset_all(self) -> None:
+        """Reset the text of every editable field to its value.
+
+        This is the slot connected to the Reset All button."""
+        for tag in TAGS:
+            # The text of an unmodified field already equals its value.
+            if self.tags[tag].modified:
+                self.tags[tag].reset_function()
+
+    @QtCore.pyqtSlot()
     def save_file(self) -> None:
         """If there was any change in metadata, save the changes.
 
         This is the slot connected to the Save button.
+        Nothing is written if the new metadata are the same as the current ones.
         The resulting file path is the ``file_path`` attribute.
         If the ``backup`` attribute is set to True, the existing file at ``file_path`` (if any)
-        is renamed to back it up."""
-        if all(not data.modified for data in self.tags.values()):
+        is backed up first.
+        If the ``incremental`` attribute is set to True, the new metadata are appended
+        to the file at ``file_path`` in place (see ``append_file``);
+        the whole document is rewritten if that is not possible (see ``rewrite_file``).
+        If the writing fails or is cancelled by the user, the edited fields are marked
+        as modified again, and an error message is displayed in case of failure.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from pypdf.errors import PdfReadError
+
+        # Only the editable fields can be modified.
+        modified = [tag for tag in TAGS if self.tags[tag].modified]
+        if not modified:
             return
-        for data in self.tags.values():
-            data.save_function()
-        if self.backup:
-            self.create_file_backup(self.file_path)
-        # Note: PdfWriter initialises the "/Producer" metadata with "pypdf".
-        file_writer = pypdf.PdfWriter()
-        file_writer.clone_reader_document_root(self.file_reader)
-        file_writer.add_metadata(
-            {tag: data.value for tag, data in self.tags.items() if data.value}
+        # The metadata last saved (or read), to compare the new ones with.
+        saved_metadata = {
+            tag: data.value for tag, data in self.tags.items() if data.value
+        }
+        for tag in modified:
+            self.tags[tag].save_function()
+        metadata = {tag: data.value for tag, data in self.tags.items() if data.value}
+        if metadata == saved_metadata:
+            return
+        save_button = self.other_interactive_widgets["save"]
+        save_button.setEnabled(False)
+        self.saving.emit(True)
+        try:
+            update: Optional[bytes] = None
+            if self.incremental:
+                buffer = BytesIO()
+                if write_info_update(
+                    self.file_reader, metadata, buffer, original=False
+                ):
+                    update = buffer.getvalue()
+            if update is None or not self.append_file(update):
+                self.rewrite_file(metadata, update)
+        # Roll back whatever the failure; unexpected exceptions are raised again below.
+        # pylint: disable-next=broad-exception-caught
+        except BaseException as exception:
+            # Nothing was saved.
+            for tag in modified:
+                self.tags[tag].value = saved_metadata.get(tag, "")
+                self.tags[tag].edit_function()
+            # An exception escaping a slot would abort the application.
+            if isinstance(exception, PermissionError):
+                QtWidgets.QMessageBox.critical(
+                    self, "Error", "You do not have permission to write the file"
+                )
+            elif isinstance(exception, (OSError, PdfReadError)):
+                QtWidgets.QMessageBox.critical(
+                    self, "Error", "The file could not be saved"
+                )
+            elif not isinstance(exception, TaskCancelled):
+                raise
+            return
+        finally:
+            # A cancelled task may still be using file_reader (see task_ended).
+            save_button.setEnabled(not self.running_tasks)
+            self.saving.emit(False)
+        self.file_saved.emit(str(self.file_path))
+
+    def append_file(self, update: bytes) -> bool:
+        """Append an incremental update to the file at ``file_path``.
+
+        Only the update (a few kB) is written, and the backup is a copy of the file,
+        so the original document is never rewritten.
+        If the write fails, the file is truncated back to its original size.
+        Nothing is done and False is returned if the file at ``file_path`` is not the one
+        read by ``file_reader``, e.g. it was deleted or modified since; otherwise return True.
+        On success, ``file_reader`` is replaced by a reader of the updated file,
+        so that the next save can be appended as well.
+
+        Parameters
+        ----------
+        update : bytes
+            The incremental update, as written by ``write_info_update``.
+        """
+        data = self.file_reader.stream.getvalue()
+        try:
+            f = open(self.file_path, "r+b")
+        except FileNotFoundError:
+            return False
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(size - 1024, 0))
+            if size != len(data) or f.read() != data[-1024:]:
+                return False
+            backup_path = (
+                self.create_file_backup(self.file_path, copy=True)
+                if self.backup
+                else None
+            )
+            try:
+                f.write(update)
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                # Restore the original file.
+                f.truncate(size)
+                if backup_path is not None:
+                    os.remove(backup_path)
+                raise
+        self.reload_file(data + update)
+        return True
+
+    def rewrite_file(self, metadata: dict[str, Any], update: Optional[bytes]) -> None:
+        """Write the file at ``file_path`` with ``metadata`` as its new document information.
+
+        If an incremental ``update`` is given, the original document is kept as is
+        and the update is appended to it; otherwise the whole document is rewritten.
+        The document is rewritten in the background (see ``write_document``),
+        and the user may cancel it, in which case TaskCancelled is raised.
+        The new file is written to a temporary file first, and only replaces the file at
+        ``file_path`` once it is complete, so that a failed write leaves it untouched.
+        The existing file, if any, is copied to back it up if ``backup`` is set to True,
+        so that there is always a file at ``file_path``.
+        Afterwards, ``file_reader`` is replaced by a reader of the new file.
+
+        Parameters
+        ----------
+        metadata : dict[str, Any]
+            The new document information dictionary, tag -> value.
+        update : bytes, optional
+            The incremental update setting ``metadata``, as written by ``write_info_update``.
+        """
+        if update is not None:
+            data = self.file_reader.stream.getvalue() + update
+        else:
+            self.running_tasks += 1
+            data = run_in_background(
+                self,
+                "Saving file...",
+                write_document,
+                self.file_reader,
+                metadata,
+                ended=self.task_ended,
+            )
+        # A unique name, so that no existing file is overwritten.
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(self.file_path) or os.curdir
         )
-        with open(self.file_path, "wb") as f:
-            file_writer.write(f)
+        backup_path = None
+        try:
+            with open(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp makes the file private: use the permissions of the file it replaces.
+            try:
+                shutil.copymode(self.file_path, temp_path)
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temp_path, 0o666 & ~umask)
+            if self.backup:
+                backup_path = self.create_file_backup(self.file_path, copy=True)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            # Leave neither a partial file nor the backup of an unchanged file behind.
+            os.remove(temp_path)
+            if backup_path is not None:
+                os.remove(backup_path)
+            raise
+        self.reload_file(data)
+
+    @QtCore.pyqtSlot()
+    def task_ended(self) -> None:
+        """Record the end of a background task using ``file_reader``.
+
+        Saving is allowed again once no such task is running,
+        as pypdf objects must not be used by two threads at once."""
+        self.running_tasks -= 1
+        if not self.running_tasks:
+            self.other_interactive_widgets["save"].setEnabled(True)
+
+    def reload_file(self, data: bytes) -> None:
+        """Replace ``file_reader`` with a PdfReader of ``data``, the contents just saved.
 
-    def create_file_backup(self, file_path: str) -> None:
-        """Rename the file for backup purposes.
+        Parameters
+        ----------
+        data : bytes
+            The contents of the file at ``file_path``.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import pypdf
+
+        self.file_reader = pypdf.PdfReader(BytesIO(data))
+
+    def create_file_backup(self, file_path: str, copy: bool = False) -> Optional[str]:
+        """Rename (or copy) the file for backup purposes, and return the backup file path.
 
         The file is renamed by adding a .bak extension.
         If such file already exists, it is renamed by appending .bak1,
-        .bak2, and so on, until an available file name is found.
-        If the file to rename does not exist, display a warning message.
+        .bak2, and so on, using the first available file name.
+        The new name is reserved by creating it exclusively before the file is moved onto it,
+        so that an existing file is never overwritten.
+        If the file to rename does not exist, display a warning message and return None.
 
         Parameters
         ----------
         file_path : str
             The path of the file to back up.
+        copy : bool
+            If True, the file is copied (with its permissions) instead of renamed.
+            shutil.copy uses the fastest copy available on the platform.
         """
 
         def new_file_name(i: int) -> str:
             return f"{file_path}.bak{i if i else ''}"
 
+        dir_name, base_name = os.path.split(file_path)
+        # List the directory once, instead of checking each candidate name separately.
+        with os.scandir(dir_name or os.curdir) as entries:
+            existing = {
+                entry.name for entry in entries if entry.name.startswith(base_name)
+            }
         i = 0
-        # On Unix systems, os.rename does not raise exceptions if the destination already exists.
-        while os.path.isfile(new_file_name(i)):
-            i += 1
+        while True:
+            while os.path.basename(new_file_name(i)) in existing:
+                i += 1
+            try:
+                os.close(
+                    os.open(
+                        new_file_name(i), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666
+                    )
+                )
+                break
+            except FileExistsError:
+                # The name was taken after the directory was listed.
+                i += 1
         try:
-            os.rename(file_path, new_file_name(i))
+            if copy:
+                # Copy the permissions as well, as renaming would keep them.
+                shutil.copy(file_path, new_file_name(i))
+            else:
+                os.replace(file_path, new_file_name(i))
         except FileNotFoundError:
+            os.remove(new_file_name(i))
             QtWidgets.QMessageBox.warning(
                 self,
                 "Missing file",
@@ -324,6 +987,21 @@ class MetadataPanel(QtWidgets.QWidget):
                     "The original file may have been renamed, moved, or deleted."
                 ),
             )
+            return None
+        return new_file_name(i)
+
+    def disconnect_signals(self) -> None:
+        """Disconnect the signals of the panel and of its interactive widgets.
+
+        It is called before the panel is replaced, so that no event queued
+        while it awaits deletion reaches its slots."""
+        self.blockSignals(True)
+        for data in self.tags.values():
+            if data.interactive:
+                data.line_edit.textEdited.disconnect()
+                data.reset_button.clicked.disconnect()
+        for widget in self.other_interactive_widgets.values():
+            widget.clicked.disconnect()
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -335,6 +1013,14 @@ class MainWindow(QtWidgets.QMainWindow):
         A dictionary to easily access the actions used in the menu.
     central_widget : QWidget
         The interface to edit metadata.
+    reader_cache : OrderedDict[tuple[str, int, int], PdfReader]
+        The most recently opened PdfReader objects, keyed by file path, modification time and size.
+        The files add up to at most ``READER_CACHE_BYTES``, larger ones are not cached;
+        the least recently used entry is discarded first.
+    last_directory : str
+        The directory the file selection window opens in: the one of the last selected file.
+    opening_disabled : int
+        The number of operations in progress that prevent opening files (see ``disable_opening``).
 
     Methods
     -------
@@ -359,15 +1045,30 @@ class MainWindow(QtWidgets.QMainWindow):
         Include handling the decryption of password-protected files.
         Display an error message in case of failed decryption or if the file cannot be opened.
         Display a warning message if the file cannot be read in strict mode.
+        The file is parsed in the background; the user can stop waiting for it.
+    report_open_error(error)
+        Display an error message explaining why a file could not be opened.
+    decrypt_file(file_reader)
+        Prompt the user for the password of an encrypted file until it is decrypted.
+    uncache_reader(file_path)
+        Remove the cached PdfReader objects of the file at ``file_path``.
+    disable_opening(flag)
+        Prevent (or allow again) opening files, from the menu or by dropping them.
     """
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.setWindowTitle(APPLICATION_NAME)
+        self.setStyleSheet(STYLESHEET)
         self.setGeometry(400, 400, 500, 500)
         self.actions = self.create_actions()
         self.create_menu()
         self.central_widget = QtWidgets.QWidget()
+        self.reader_cache: OrderedDict[tuple[str, int, int], pypdf.PdfReader] = (
+            OrderedDict()
+        )
+        self.last_directory = os.path.expanduser("~")
+        self.opening_disabled = 0
         self.setAcceptDrops(True)
         self.show()
 
@@ -415,6 +1116,7 @@ class MainWindow(QtWidgets.QMainWindow):
         file_menu.addAction(self.actions["quit"])
         help_menu.addAction(self.actions["about"])
 
+    @QtCore.pyqtSlot()
     def show_about(self) -> None:
         """Display the "About" information."""
         QtWidgets.QMessageBox.about(
@@ -436,24 +1138,44 @@ class MainWindow(QtWidgets.QMainWindow):
             The path of the file whose metadata will be displayed for editing.
         """
         if file_path:
-            file_object = self.open_file(file_path)
+            # Opening a file runs a nested event loop:
+            # don't let the user start opening another file meanwhile.
+            self.disable_opening(True)
+            try:
+                file_object = self.open_file(file_path)
+            finally:
+                self.disable_opening(False)
             if file_object is not None:
-                self.central_widget = MetadataPanel(file_object, file_path)
-                self.setCentralWidget(self.central_widget)
-
+                if isinstance(self.central_widget, MetadataPanel):
+                    self.central_widget.disconnect_signals()
+                # Repaint the window once, after the new panel is in place.
+                self.setUpdatesEnabled(False)
+                try:
+                    self.central_widget = MetadataPanel(file_object, file_path)
+                    self.central_widget.file_saved.connect(self.uncache_reader)
+                    self.central_widget.saving.connect(self.disable_opening)
+                    self.setCentralWidget(self.central_widget)
+                finally:
+                    self.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot()
     def select_file(self) -> None:
         """Handle file selection.
 
-        Open a standard file selection window, with .pdf extension as default filter.
+        Open a standard file selection window, with .pdf extension as default filter,
+        in the directory of the last selected file.
         If the user selects a file, open it in the current session.
         """
         # getOpenFileName returns a tuple of strings (path, filter)
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select file",
-            os.path.expanduser("~"),
+            self.last_directory,
             "PDF files (*.pdf);;All files (*.*)",
+            options=QtWidgets.QFileDialog.Option.DontResolveSymlinks,
         )
+        if file_path:
+            self.last_directory = os.path.dirname(file_path)
         self.display_metadata(file_path)
 
     # Reimplement dragEnterEvent class method
@@ -466,7 +1188,7 @@ class MainWindow(QtWidgets.QMainWindow):
         event : QDragEnterEvent
         """
         # hasUrls is true when dragging files because of their path.
-        if event.mimeData().hasUrls:
+        if event.mimeData().hasUrls():
             event.accept()
         else:
             event.ignore()
@@ -474,61 +1196,120 @@ class MainWindow(QtWidgets.QMainWindow):
     # Reimplement dropEvent class method
     # pylint:disable-next=invalid-name
     def dropEvent(self, event: QtGui.QDropEvent) -> None:
-        """Attempt to open the file dropped onto the window."""
-        for url in event.mimeData().urls():
-            self.display_metadata(url.toLocalFile())
+        """Attempt to open the file dropped onto the window.
+
+        If several files are dropped, ask the user which one to open,
+        instead of opening each of them in turn only to display the last one."""
+        # Remove duplicates, preserving the order.
+        file_paths = list(
+            dict.fromkeys(
+                url.toLocalFile()
+                for url in event.mimeData().urls()
+                if url.isLocalFile()
+            )
+        )
+        if len(file_paths) > 1:
+            file_path, ok = QtWidgets.QInputDialog.getItem(
+                self, "Open file", "Select the file to open:", file_paths, 0, False
+            )
+            if not ok:
+                return
+        elif file_paths:
+            file_path = file_paths[0]
+        else:
+            return
+        self.display_metadata(file_path)
 
     def open_file(self, file_path: str) -> Optional[pypdf.PdfReader]:
         """Return the PdfReader object for the file at ``file_path``, if possible.
 
-        If the file cannot be opened (e.g. not a PDF file), display an error message.
+        If the file cannot be opened (e.g. not a PDF file, missing file, no read permission),
+        display an error message.
         If the file is password-protected, prompt the user to insert the password
         until either the correct password is provided or the 'Cancel' button is pressed.
         Display an error message in case of incorrect password.
         If the file cannot be opened in strict mode, i.e. it does not follows 1.7 specifications,
         display a warning message asking the user whether to proceed.
+        The file is parsed once, in strict mode, falling back to the default mode if that fails,
+        without blocking the GUI; if it takes long enough, a progress dialog allows the user
+        to cancel the operation.
         For more information about pypdf strict mode, see
         https://pypdf.readthedocs.io/en/latest/user/robustness.html.
+        If the same file was opened recently and has not changed since,
+        return the cached PdfReader object instead, skipping all of the above.
 
         Parameters
         ----------
         file_path : str
             The file path to read.
         """
+        # pylint: disable-next=import-outside-toplevel
+        import pypdf
+
+        # pylint: disable-next=import-outside-toplevel
+        from pypdf.errors import PdfReadError
+
+        try:
+            stat = os.stat(file_path)
+            cache_key = (os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key in self.reader_cache:
+            self.reader_cache.move_to_end(cache_key)
+            return self.reader_cache[cache_key]
+
+        cancelled = threading.Event()
+
+        def read_file() -> tuple[pypdf.PdfReader, bool]:
+            """Read the whole file in memory, and parse it from there.
+
+            The file is parsed in strict mode first, and parsed again in the default mode
+            only if that fails; return the reader, and whether strict mode succeeded.
+            Stop as soon as possible if the user cancels the operation."""
+            data = BytesIO()
+            with open(file_path, "rb") as f:
+                # Don't read a whole large file that is not a PDF.
+                # The header is allowed anywhere in the first 1024 bytes.
+                header = f.read(1024)
+                if b"%PDF-" not in header:
+                    raise PdfReadError("PDF header not found")
+                data.write(header)
+                for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                    if cancelled.is_set():
+                        raise TaskCancelled
+                    data.write(chunk)
+            if cancelled.is_set():
+                raise TaskCancelled
+            try:
+                return pypdf.PdfReader(data, strict=True), True
+            except PdfReadError:
+                data.seek(0)
+                return pypdf.PdfReader(data), False
+
         # Catch files that cannot be read (e.g. non-pdf files).
+        # Parsing large files takes a while: do it without freezing the GUI.
         try:
-            file_reader = pypdf.PdfReader(file_path)
-        except PdfReadError:
-            QtWidgets.QMessageBox.critical(
-                self, "Error", "The file could not be opened"
+            file_reader, strict = run_in_background(
+                self, "Opening file...", read_file, cancelled=cancelled
             )
+        except TaskCancelled:
+            return None
+        except (OSError, PdfReadError) as error:
+            self.report_open_error(error)
             return None
         # If the file is password-protected, prompt the user to insert the password.
-        if file_reader.is_encrypted:
-            decrypted = None
-            while not decrypted:
-                password, ok = QtWidgets.QInputDialog.getText(
-                    self,
-                    "Encrypted file",
-                    "Insert password:",
-                    QtWidgets.QLineEdit.EchoMode.Password,
-                )
-                # Do nothing if the Cancel button is selected.
-                if not ok:
-                    return None
-                decrypted = file_reader.decrypt(password)
-                # Display an error message if the password is incorrect.
-                if not decrypted:
-                    QtWidgets.QMessageBox.critical(self, "Error", "Incorrect password")
-        # Robustness check. Ask confirmation from the user to continue.
-        try:
-            file_reader_robust = pypdf.PdfReader(
-                file_path,
-                strict=True,
-                password=password if file_reader.is_encrypted else None,
-            )
-            assert file_reader_robust.metadata is not None
-        except PdfReadError:
+        if file_reader.is_encrypted and not self.decrypt_file(file_reader):
+            return None
+
+        # Robustness check, completed by reading the (decrypted) metadata in strict mode.
+        # Ask confirmation from the user to continue.
+        if strict:
+            try:
+                _ = file_reader.metadata
+            except PdfReadError:
+                strict = False
+        file_reader.strict = False
+        if not strict:
             answer = QtWidgets.QMessageBox.question(
                 self,
                 "Warning",
@@ -546,11 +1327,98 @@ class MainWindow(QtWidgets.QMainWindow):
             # Do nothing unless the user chooses to proceed.
             if answer != QtWidgets.QMessageBox.StandardButton.Yes:
                 return None
-        except AssertionError:
-            pass
 
+        if cache_key is not None and cache_key[2] <= READER_CACHE_BYTES:
+            self.reader_cache[cache_key] = file_reader
+            while sum(key[2] for key in self.reader_cache) > READER_CACHE_BYTES:
+                self.reader_cache.popitem(last=False)
         return file_reader
 
+    @QtCore.pyqtSlot(str)
+    def report_open_error(self, error: Exception) -> None:
+        """Display an error message explaining why a file could not be opened.
+
+        Parameters
+        ----------
+        error : Exception
+            The exception raised while reading the file.
+        """
+        if isinstance(error, FileNotFoundError):
+            message = "The file does not exist"
+        elif isinstance(error, PermissionError):
+            message = "You do not have permission to read the file"
+        else:
+            message = "The file could not be opened"
+        QtWidgets.QMessageBox.critical(self, "Error", message)
+
+    def decrypt_file(self, file_reader: pypdf.PdfReader) -> bool:
+        """Prompt the user for the password of ``file_reader`` until it is decrypted.
+
+        Display an error message in case of incorrect password.
+        Return True once the file is decrypted, False if the user gives up.
+
+        Parameters
+        ----------
+        file_reader : PdfReader
+            The reader of the encrypted file.
+        """
+        decrypted = None
+        while not decrypted:
+            password, ok = QtWidgets.QInputDialog.getText(
+                self,
+                "Encrypted file",
+                "Insert password:",
+                QtWidgets.QLineEdit.EchoMode.Password,
+            )
+            # Do nothing if the Cancel button is selected.
+            if not ok:
+                return False
+            # Deriving the key from the password is expensive (e.g. AES-256).
+            try:
+                decrypted = run_in_background(
+                    self, "Decrypting file...", file_reader.decrypt, password
+                )
+            except TaskCancelled:
+                return False
+            # Display an error message if the password is incorrect.
+            if not decrypted:
+                QtWidgets.QMessageBox.critical(self, "Error", "Incorrect password")
+        return True
+
+    def uncache_reader(self, file_path: str) -> None:
+        """Remove all the cached PdfReader objects of the file at ``file_path``.
+
+        It is the slot called when a MetadataPanel saves a file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file whose cached PdfReader objects are discarded.
+        """
+        file_path = os.fspath(file_path)
+        for cache_key in [key for key in self.reader_cache if key[0] == file_path]:
+            del self.reader_cache[cache_key]
+
+    @QtCore.pyqtSlot(bool)
+    def disable_opening(self, flag: bool) -> None:
+        """Prevent opening files if ``flag`` is True, allow it again otherwise.
+
+        It is used while a nested event loop runs (opening or saving a file),
+        so that the panel is not replaced in the meantime.
+        It is the slot called when a MetadataPanel starts and finishes saving.
+        Calls are counted, as such operations may overlap: opening files is allowed again
+        only once every call with True has been matched by a call with False.
+
+        Parameters
+        ----------
+        flag : bool
+            True to prevent opening files, False to allow it.
+        """
+        self.opening_disabled += 1 if flag else -1
+        enabled = not self.opening_disabled
+        self.actions["open"].setEnabled(enabled)
+        self.setAcceptDrops(enabled)
+
 
 def main() -> None:
     """The application main loop."""
@@ -46,7 +46,20 @@ def encrypted_pdf_user(tmp_path: Path) -> Generator[Path, None, None]:
 
     User password: asdfzxcv"""
     copy_path = shutil.copy2(
-        SAMPLE_ROOT / "r6-both-passwords.pdf", tmp_path / "file.pdf"
+        SAMPLE_ROOT / "r6-user-password.pdf", tmp_path / "file.pdf"
+    )
+    yield copy_path
+
+
+@pytest.fixture(params=["xref-table", "xref-stream"])
+def no_info_pdf(
+    tmp_path: Path, request: pytest.FixtureRequest
+) -> Generator[Path, None, None]:
+    """Pdf file without document information dictionary.
+
+    Parameter: the kind of its cross-reference section."""
+    copy_path = shutil.copy2(
+        SAMPLE_ROOT / f"no-info-{request.param}.pdf", tmp_path / "file.pdf"
     )
     yield copy_path
 
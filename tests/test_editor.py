@@ -1,13 +1,16 @@
 """Tests."""
 
 import os
+import threading
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock
 import pypdf
 import pytest
 from pytestqt.qtbot import QtBot
-from PyQt6 import QtWidgets, QtCore
+from PyQt6 import QtWidgets, QtCore, QtGui
 from pdfMetadataEditor import MainWindow
+from pdfMetadataEditor import editor
 from pdfMetadataEditor.editor import TAGS
 
 PASSWORD = "asdfzxcv"
@@ -29,6 +32,17 @@ def test_open_not_pdf(
     assert file_reader is None
 
 
+def test_open_missing_file(
+    window: MainWindow, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Fail to open a file that does not exist."""
+    critical = Mock()
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", critical)
+    file_reader = window.open_file(tmp_path / "missing.pdf")
+    assert file_reader is None
+    assert critical.call_args[0][2] == "The file does not exist"
+
+
 def test_open_unencrypted_pdf(window: MainWindow, base_pdf: Path) -> None:
     """Open a trivial pdf file."""
     file_reader = window.open_file(base_pdf)
@@ -36,6 +50,42 @@ def test_open_unencrypted_pdf(window: MainWindow, base_pdf: Path) -> None:
     # PdfReader metadata attribute is accessible if the document is not encrypted
 
 
+@pytest.mark.parametrize("proceed", [True, False])
+def test_open_non_compliant_pdf(
+    window: MainWindow,
+    base_pdf: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    proceed: bool,
+) -> None:
+    """Open a file that can only be read in non-strict mode if the user agrees to."""
+    data = base_pdf.read_bytes()
+    startxref = data.rindex(b"startxref")
+    # Make the cross-reference offset slightly wrong
+    offset = int(data[startxref + 9 :].split()[0])
+    base_pdf.write_bytes(data[:startxref] + b"startxref\n%d\n%%%%EOF\n" % (offset - 5))
+    question = Mock(
+        return_value=(
+            QtWidgets.QMessageBox.StandardButton.Yes
+            if proceed
+            else QtWidgets.QMessageBox.StandardButton.No
+        )
+    )
+    monkeypatch.setattr(QtWidgets.QMessageBox, "question", question)
+    file_reader = window.open_file(base_pdf)
+    assert question.called
+    assert (file_reader is not None) == proceed
+
+
+def test_open_compliant_pdf_no_warning(
+    window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Open a file that follows the specifications without any warning."""
+    question = Mock()
+    monkeypatch.setattr(QtWidgets.QMessageBox, "question", question)
+    assert window.open_file(base_pdf) is not None
+    assert not question.called
+
+
 def test_open_encrypted_pdf_correct_password(
     window: MainWindow, encrypted_pdf_both: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -243,3 +293,475 @@ def test_modify_file_twice(qtbot: QtBot, window: MainWindow, base_pdf: Path) ->
         pypdf.PdfReader(dir_path / backup_name_1).metadata[tag] + "a"
         == pypdf.PdfReader(dir_path / file_name).metadata[tag]
     )
+
+
+def test_reopen_file_uses_cache(window: MainWindow, base_pdf: Path) -> None:
+    """Opening the same unchanged file twice returns the same PdfReader object."""
+    file_reader = window.open_file(base_pdf)
+    assert window.open_file(base_pdf) is file_reader
+
+
+def test_reader_cache_size(
+    window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The cached PdfReader objects are limited by the total size of their files."""
+    size = base_pdf.stat().st_size
+    monkeypatch.setattr(editor, "READER_CACHE_BYTES", 2 * size)
+    paths = [base_pdf.parent / f"copy{i}.pdf" for i in range(3)]
+    for path in paths:
+        path.write_bytes(base_pdf.read_bytes())
+        window.open_file(path)
+    # The least recently used file is discarded.
+    assert [key[0] for key in window.reader_cache] == [str(path) for path in paths[1:]]
+    # Files larger than the limit are not cached at all.
+    monkeypatch.setattr(editor, "READER_CACHE_BYTES", size - 1)
+    window.reader_cache.clear()
+    window.open_file(base_pdf)
+    assert not window.reader_cache
+
+
+def test_reopen_file_after_save(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """Saving a file discards its cached PdfReader object."""
+    tag = "/Title"  # No need to parametrise this test
+    window.display_metadata(base_pdf)
+    file_reader = window.central_widget.file_reader
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert not window.reader_cache
+    new_reader = window.open_file(base_pdf)
+    assert new_reader is not file_reader
+    assert new_reader.metadata[tag] == file_reader.metadata.get(tag, "") + "a"
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_save_file_incremental(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, incremental: bool
+) -> None:
+    """The edited metadata are appended to the original file, unless disabled."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    window.display_metadata(base_pdf)
+    window.central_widget.incremental = incremental
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    new_bytes = base_pdf.read_bytes()
+    # The original document is left untouched only by incremental updates
+    assert new_bytes.startswith(original_bytes) == incremental
+    new_reader = pypdf.PdfReader(base_pdf, strict=True)
+    assert new_reader.metadata[tag] == "a"
+    assert len(new_reader.pages) == len(
+        pypdf.PdfReader(base_pdf.parent / (base_pdf.name + ".bak")).pages
+    )
+
+
+def test_run_in_background(window: MainWindow) -> None:
+    """The result of a background task is returned in the GUI thread."""
+    assert editor.run_in_background(window, "", sum, (1, 2)) == 3
+
+
+def test_run_in_background_error(window: MainWindow) -> None:
+    """The exception raised by a background task is raised in the GUI thread."""
+    with pytest.raises(ZeroDivisionError):
+        editor.run_in_background(window, "", divmod, 1, 0)
+
+
+def test_run_in_background_cancelled(window: MainWindow) -> None:
+    """The user stops waiting for a background task."""
+    release = threading.Event()
+    visible = []
+
+    def cancel() -> None:
+        dialog = window.findChild(QtWidgets.QProgressDialog)
+        visible.append(dialog.isVisible())
+        dialog.findChild(QtWidgets.QPushButton).click()
+
+    QtCore.QTimer.singleShot(2 * editor.PROGRESS_DIALOG_DELAY, cancel)
+    cancelled = threading.Event()
+    with pytest.raises(editor.TaskCancelled):
+        editor.run_in_background(window, "", release.wait, 5, cancelled=cancelled)
+    # The progress dialog is shown shortly after the task starts
+    assert visible == [True]
+    # The task is notified, to stop early if it can
+    assert cancelled.is_set()
+    release.set()
+
+
+def test_edit_highlights_field(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """Editing a field highlights it, resetting it removes the highlight."""
+    tag = "/Title"  # No need to parametrise this test
+    window.display_metadata(base_pdf)
+    line_edit = window.central_widget.tags[tag].line_edit
+
+    def background() -> QtGui.QColor:
+        image = line_edit.grab().toImage()
+        return image.pixelColor(image.width() - 5, image.height() // 2)
+
+    qtbot.keyPress(line_edit, "a")
+    assert background() == QtGui.QColor("red")
+    window.central_widget.tags[tag].reset_button.click()
+    assert background() != QtGui.QColor("red")
+
+
+def test_save_file_write_error(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed write is reported, leaving the original file untouched and no other file behind."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    window.display_metadata(base_pdf)
+    monkeypatch.setattr(editor, "write_info_update", Mock(side_effect=OSError))
+    critical = Mock()
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", critical)
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    critical.assert_called_once()
+    # The field is still marked as modified
+    assert window.central_widget.tags[tag].modified
+    # No new file is created
+    assert os.listdir(dir_path) == [base_pdf.name]
+    # The contents of the file have not changed
+    assert base_pdf.read_bytes() == original_bytes
+
+
+def test_save_file_rewrite_replace_error(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """If the file cannot be replaced, neither the new file nor the backup is left behind."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    window.display_metadata(base_pdf)
+    window.central_widget.incremental = False
+    monkeypatch.setattr(os, "replace", Mock(side_effect=PermissionError))
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", Mock())
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert os.listdir(dir_path) == [base_pdf.name]
+    assert base_pdf.read_bytes() == original_bytes
+
+
+def test_reopen_file_disconnects_old_panel(window: MainWindow, base_pdf: Path) -> None:
+    """Opening a file disconnects the widgets of the panel it replaces."""
+    window.display_metadata(base_pdf)
+    old_panel = window.central_widget
+    window.display_metadata(base_pdf)
+    assert window.central_widget is not old_panel
+    save_button = old_panel.other_interactive_widgets["save"]
+    assert save_button.receivers(save_button.clicked) == 0
+    reset_button = old_panel.tags["/Title"].reset_button
+    assert reset_button.receivers(reset_button.clicked) == 0
+
+
+def test_save_file_unchanged_metadata(window: MainWindow, base_pdf: Path) -> None:
+    """Don't write anything if the metadata to save are the current ones."""
+    expected = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    window.display_metadata(base_pdf)
+    window.central_widget.tags["/Title"].modified = True
+    window.central_widget.save_file()
+    # No new file is created
+    assert os.listdir(dir_path) == [base_pdf.name]
+    # The contents of the file have not changed
+    assert base_pdf.read_bytes() == expected
+
+
+def test_save_file_existing_backup(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """An existing backup file is not overwritten."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    old_backup = dir_path / (base_pdf.name + ".bak")
+    old_backup.write_bytes(b"old backup")
+    window.display_metadata(base_pdf)
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert old_backup.read_bytes() == b"old backup"
+    assert (dir_path / (base_pdf.name + ".bak1")).read_bytes() == original_bytes
+
+
+def test_save_file_appends_in_place(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """The incremental updates are appended to the original file, which is backed up by copy."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    base_pdf.chmod(0o640)
+    # Read back, as chmod only sets the read-only flag on Windows.
+    mode = base_pdf.stat().st_mode
+    inode = base_pdf.stat().st_ino
+    window.display_metadata(base_pdf)
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    # The file was not replaced
+    assert base_pdf.stat().st_ino == inode
+    first_save_bytes = base_pdf.read_bytes()
+    assert first_save_bytes.startswith(original_bytes)
+    backup = base_pdf.parent / (base_pdf.name + ".bak")
+    assert backup.read_bytes() == original_bytes
+    # The backup has the same permissions as the original file
+    assert backup.stat().st_mode == mode
+    assert pypdf.PdfReader(base_pdf, strict=True).metadata[tag] == "a"
+    # Later saves are appended as well
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "b")
+    window.central_widget.save_file()
+    assert base_pdf.stat().st_ino == inode
+    assert base_pdf.read_bytes().startswith(first_save_bytes)
+    assert pypdf.PdfReader(base_pdf, strict=True).metadata[tag] == "ab"
+
+
+def test_drop_several_files(
+    window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only the file chosen among the dropped ones is opened."""
+    other_pdf = base_pdf.parent / "other.pdf"
+    other_pdf.write_bytes(base_pdf.read_bytes())
+    # Local paths as Qt returns them, i.e. with forward slashes on Windows.
+    base_path, other_path = (
+        QtCore.QUrl.fromLocalFile(str(path)).toLocalFile()
+        for path in (base_pdf, other_pdf)
+    )
+    get_item = Mock(return_value=(other_path, True))
+    monkeypatch.setattr(QtWidgets.QInputDialog, "getItem", get_item)
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", lambda *args: None)
+    event = Mock()
+    event.mimeData().urls.return_value = [
+        QtCore.QUrl.fromLocalFile(str(path)) for path in (base_pdf, other_pdf, base_pdf)
+    ]
+    window.dropEvent(event)
+    # Duplicates are offered once
+    assert get_item.call_args[0][3] == [base_path, other_path]
+    assert window.central_widget.file_path == other_path
+
+
+@pytest.mark.parametrize("has_urls", [True, False])
+def test_drag_enter_accepts_urls_only(window: MainWindow, has_urls: bool) -> None:
+    """Only drags carrying URLs are accepted."""
+    event = Mock()
+    event.mimeData().hasUrls.return_value = has_urls
+    window.dragEnterEvent(event)
+    assert event.accept.called == has_urls
+    assert event.ignore.called != has_urls
+
+
+def test_open_file_disables_opening(
+    window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """No other file can be opened while a file is being opened."""
+    states = []
+    open_file = window.open_file
+
+    def mock_open_file(file_path: str) -> pypdf.PdfReader:
+        states.append((window.actions["open"].isEnabled(), window.acceptDrops()))
+        return open_file(file_path)
+
+    monkeypatch.setattr(window, "open_file", mock_open_file)
+    window.display_metadata(base_pdf)
+    assert states == [(False, False)]
+    assert window.actions["open"].isEnabled()
+    assert window.acceptDrops()
+
+
+def test_save_file_while_opening_keeps_opening_disabled(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Saving the current file while another one is being opened does not allow opening."""
+    tag = "/Title"  # No need to parametrise this test
+    window.display_metadata(base_pdf)
+    panel = window.central_widget
+    states = []
+    open_file = window.open_file
+
+    def mock_open_file(file_path: str) -> pypdf.PdfReader:
+        qtbot.keyPress(panel.tags[tag].line_edit, "a")
+        panel.save_file()
+        states.append((window.actions["open"].isEnabled(), window.acceptDrops()))
+        return open_file(file_path)
+
+    monkeypatch.setattr(window, "open_file", mock_open_file)
+    window.display_metadata(base_pdf)
+    assert states == [(False, False)]
+    assert window.actions["open"].isEnabled()
+    assert window.acceptDrops()
+
+
+def test_save_file_rewrite_keeps_other_files(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """Rewriting a file does not touch files with similar names, and keeps permissions."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    other_file = dir_path / (base_pdf.name + ".tmp")
+    other_file.write_bytes(b"user data")
+    base_pdf.chmod(0o640)
+    # Read back, as chmod only sets the read-only flag on Windows.
+    mode = base_pdf.stat().st_mode
+    window.display_metadata(base_pdf)
+    window.central_widget.incremental = False
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert other_file.read_bytes() == b"user data"
+    assert set(os.listdir(dir_path)) == {
+        base_pdf.name,
+        base_pdf.name + ".bak",
+        other_file.name,
+    }
+    assert (dir_path / (base_pdf.name + ".bak")).read_bytes() == original_bytes
+    assert base_pdf.stat().st_mode == mode
+    assert pypdf.PdfReader(base_pdf).metadata[tag] == "a"
+
+
+def test_save_file_rewrite_in_background(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The document is rewritten in the background, and no file can be opened meanwhile."""
+    tag = "/Title"  # No need to parametrise this test
+    states = []
+
+    def mock_run_in_background(_parent, _label, function, *args, ended, **kwargs):
+        states.append((window.actions["open"].isEnabled(), window.acceptDrops()))
+        try:
+            return function(*args, **kwargs)
+        finally:
+            ended()
+
+    window.display_metadata(base_pdf)
+    monkeypatch.setattr(editor, "run_in_background", mock_run_in_background)
+    window.central_widget.incremental = False
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert states == [(False, False)]
+    assert window.actions["open"].isEnabled()
+    assert window.acceptDrops()
+    assert pypdf.PdfReader(base_pdf).metadata[tag] == "a"
+
+
+def test_save_file_rewrite_cancelled(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cancelling a rewrite leaves the file untouched, and the field still modified."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    dir_path = base_pdf.parent
+    window.display_metadata(base_pdf)
+
+    def mock_run_in_background(*_args, ended, **_kwargs):
+        # The user cancels, and the task stops right away.
+        ended()
+        raise editor.TaskCancelled
+
+    monkeypatch.setattr(editor, "run_in_background", mock_run_in_background)
+    window.central_widget.incremental = False
+    data = window.central_widget.tags[tag]
+    qtbot.keyPress(data.line_edit, "a")
+    window.central_widget.save_file()
+    assert os.listdir(dir_path) == [base_pdf.name]
+    assert base_pdf.read_bytes() == original_bytes
+    assert data.modified
+    assert data.line_edit.property("edited")
+    assert window.central_widget.other_interactive_widgets["save"].isEnabled()
+
+
+def test_save_file_rewrite_cancelled_keeps_saving_disabled(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After cancelling a rewrite, saving stays disabled until the rewrite has stopped."""
+    tag = "/Title"  # No need to parametrise this test
+    original_bytes = base_pdf.read_bytes()
+    release = threading.Event()
+    write_document = editor.write_document
+
+    def slow_write_document(*args) -> bytes:
+        release.wait(5)
+        return write_document(*args)
+
+    monkeypatch.setattr(editor, "write_document", slow_write_document)
+    window.display_metadata(base_pdf)
+    window.central_widget.incremental = False
+    save_button = window.central_widget.other_interactive_widgets["save"]
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    QtCore.QTimer.singleShot(
+        2 * editor.PROGRESS_DIALOG_DELAY,
+        lambda: window.findChild(QtWidgets.QProgressDialog)
+        .findChild(QtWidgets.QPushButton)
+        .click(),
+    )
+    window.central_widget.save_file()
+    assert window.central_widget.tags[tag].modified
+    assert not save_button.isEnabled()
+    release.set()
+    qtbot.waitUntil(save_button.isEnabled)
+    assert base_pdf.read_bytes() == original_bytes
+
+
+def test_save_file_after_saved_edit_reverted(
+    qtbot: QtBot, window: MainWindow, base_pdf: Path
+) -> None:
+    """A saved edit is reverted and saved again."""
+    tag = "/Title"  # No need to parametrise this test
+    window.display_metadata(base_pdf)
+    line_edit = window.central_widget.tags[tag].line_edit
+    qtbot.keyPress(line_edit, "a")
+    window.central_widget.save_file()
+    qtbot.keyPress(line_edit, QtCore.Qt.Key.Key_Backspace)
+    window.central_widget.save_file()
+    assert tag not in pypdf.PdfReader(base_pdf).metadata
+
+
+def test_create_tags_without_metadata(
+    qapp: QtWidgets.QApplication,  # pylint: disable=unused-argument
+) -> None:
+    """A document without document information dictionary has empty editable fields."""
+    tags = editor.MetadataPanel.create_tags(Mock(metadata=None))
+    assert set(tags) == set(TAGS)
+    assert all(data.value == "" for data in tags.values())
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_save_file_without_metadata(
+    qtbot: QtBot, window: MainWindow, no_info_pdf: Path, incremental: bool
+) -> None:
+    """A document without document information dictionary is saved with a new one."""
+    tag = "/Title"  # No need to parametrise this test
+    window.display_metadata(no_info_pdf)
+    window.central_widget.incremental = incremental
+    qtbot.keyPress(window.central_widget.tags[tag].line_edit, "a")
+    window.central_widget.save_file()
+    assert pypdf.PdfReader(no_info_pdf, strict=True).metadata[tag] == "a"
+    assert not window.central_widget.tags[tag].modified
+
+
+def test_create_tags_indirect_values(
+    qapp: QtWidgets.QApplication,  # pylint: disable=unused-argument
+    base_pdf: Path,
+) -> None:
+    """Values stored as indirect objects are shown resolved."""
+    writer = pypdf.PdfWriter(clone_from=base_pdf)
+    # pypdf has no public API to add an indirect object to the document information.
+    # pylint: disable-next=protected-access
+    title = writer._add_object(pypdf.generic.TextStringObject("Indirect title"))
+    # pylint: disable-next=protected-access
+    writer._info.get_object()[pypdf.generic.NameObject("/Title")] = title
+    stream = BytesIO()
+    writer.write(stream)
+    tags = editor.MetadataPanel.create_tags(pypdf.PdfReader(stream))
+    assert tags["/Title"].value == "Indirect title"
+
+
+def test_select_file_remembers_directory(
+    window: MainWindow, base_pdf: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The file selection window opens in the directory of the last selected file."""
+    get_open_file_name = Mock(return_value=(str(base_pdf), ""))
+    monkeypatch.setattr(QtWidgets.QFileDialog, "getOpenFileName", get_open_file_name)
+    window.select_file()
+    assert get_open_file_name.call_args[0][2] == os.path.expanduser("~")
+    window.select_file()
+    assert get_open_file_name.call_args[0][2] == str(base_pdf.parent)